@@ -1,16 +1,22 @@
 #!/usr/bin/env python3
 
+import os
 import sys
-import pathlib
 import re
 import subprocess
 import typing
 import dataclasses
+from collections import defaultdict
+
+# Pattern: IMG_YYYYMMDD_HHMMSS_AATPNNNN.jpg, compiled once at import
+_BISECT_RE = re.compile(r"IMG_(\d{8}_\d{6})_AATP(\d{4})\.")
 
 
 @dataclasses.dataclass
 class ImageInfo:
-    path: pathlib.Path
+    # Plain string; pathlib.Path objects cost ~200 bytes each, which adds
+    # up over tens of thousands of timelapse frames
+    path: str
     timestamp: str
     atp_number: int
 
@@ -22,11 +28,9 @@ class BisectState:
     current_index: int
 
 
-def parse_image_filename(path: pathlib.Path) -> typing.Optional[ImageInfo]:
+def parse_image_filename(path: str) -> typing.Optional[ImageInfo]:
     """Parse image filename to extract timestamp and ATP number."""
-    # Pattern: IMG_YYYYMMDD_HHMMSS_AATPNNNN.jpg
-    pattern = r"IMG_(\d{8}_\d{6})_AATP(\d{4})\."
-    match = re.search(pattern, path.name)
+    match = _BISECT_RE.search(os.path.basename(path))
 
     if match:
         timestamp = match.group(1)
@@ -36,38 +40,72 @@ def parse_image_filename(path: pathlib.Path) -> typing.Optional[ImageInfo]:
     return None
 
 
-def sort_images(image_paths: typing.List[pathlib.Path]) -> typing.List[ImageInfo]:
+def sort_images(image_paths: typing.List[str]) -> typing.List[ImageInfo]:
     """Sort images by timestamp, then by ATP number."""
-    image_infos = []
+    # Pack (timestamp, atp_number) into a single int so each comparison
+    # is one machine-word compare instead of string + int tuple elements;
+    # the 14-digit timestamp shifted by 16 bits stays well inside 64 bits
+    decorated = []
 
     for path in image_paths:
         info = parse_image_filename(path)
         if info:
-            image_infos.append(info)
+            key = (int(info.timestamp.replace("_", "")) << 16) | info.atp_number
+            decorated.append((key, len(decorated), info))
 
-    # Sort by timestamp first, then by ATP number
-    image_infos.sort(key=lambda x: (x.timestamp, x.atp_number))
+    decorated.sort()
 
-    return image_infos
+    return [item[2] for item in decorated]
 
 
-def open_image(image_path: pathlib.Path):
+def open_image(image_path: str):
     """Open image using the system's default image viewer."""
     try:
-        subprocess.run(["open", str(image_path)], check=True)
-    except subprocess.CalledProcessError:
-        print(f"Error: Could not open {image_path}", file=sys.stderr)
+        # Fire-and-forget so the prompt comes back before the viewer
+        # finishes launching
+        subprocess.Popen(
+            ["open", image_path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
     except FileNotFoundError:
         print("Error: 'open' command not found. Are you on macOS?", file=sys.stderr)
 
 
+def show_position(
+    left: int, right: int, current_index: int, images: typing.List[ImageInfo]
+):
+    """Print the current range and image in a single stdout write."""
+    sys.stdout.write(
+        f"Range: [{left}, {right}], Current: {current_index}\n"
+        f"[{current_index + 1}/{len(images)}] {images[current_index].path}\n"
+    )
+
+
 def main():
-    # Read paths from stdin
+    # Read all of stdin as raw bytes and decode once instead of paying
+    # the text wrapper's incremental decoder per line
+    raw_paths = []
+    data = sys.stdin.buffer.read().decode("utf-8", "surrogateescape")
+    for line in data.splitlines():
+        line = line.strip()
+        if line:
+            raw_paths.append(line)
+
+    # Scan each distinct parent directory once instead of stat-ing every
+    # path individually: two syscalls per path become one listing per dir
+    by_dir = defaultdict(list)
+    for path in raw_paths:
+        by_dir[os.path.dirname(path) or "."].append(path)
+
     image_paths = []
-    for line in sys.stdin:
-        path = pathlib.Path(line.strip())
-        if path.exists() and path.is_file():
-            image_paths.append(path)
+    for parent, paths in by_dir.items():
+        try:
+            names = {e.name for e in os.scandir(parent) if e.is_file()}
+        except OSError:
+            continue
+        image_paths.extend(p for p in paths if os.path.basename(p) in names)
 
     if not image_paths:
         print("No valid image paths provided", file=sys.stderr)
@@ -92,20 +130,27 @@ def main():
     print(
         "Commands: n=bisect right (later), p=bisect left (earlier), r [count]=redo last move(s), q=quit"
     )
-    print(f"Range: [{left}, {right}], Current: {current_index}")
-
     # Open middle image and output its path
     open_image(sorted_images[current_index].path)
-    print(
-        f"[{current_index + 1}/{len(sorted_images)}] {sorted_images[current_index].path}"
-    )
+    show_position(left, right, current_index, sorted_images)
 
-    # Reopen stdin to read from terminal
-    sys.stdin = open("/dev/tty", "r")
+    # Commands come from the terminal since stdin was consumed by the
+    # path list; open it lazily (line-buffered) on the first prompt so
+    # environments without a controlling tty just exit cleanly
+    tty = None
 
     while True:
         try:
-            command = input().strip().lower()
+            if tty is None:
+                try:
+                    tty = open("/dev/tty", "r", buffering=1)
+                except OSError:
+                    break
+
+            line = tty.readline()
+            if not line:
+                break
+            command = line.strip().lower()
 
             if command == "q":
                 break
@@ -117,10 +162,7 @@ def main():
                     left = current_index + 1
                     current_index = (left + right) // 2
                     open_image(sorted_images[current_index].path)
-                    print(f"Range: [{left}, {right}], Current: {current_index}")
-                    print(
-                        f"[{current_index + 1}/{len(sorted_images)}] {sorted_images[current_index].path}"
-                    )
+                    show_position(left, right, current_index, sorted_images)
                 else:
                     print("Cannot bisect further", file=sys.stderr)
             elif command == "p":  # bisect left (go to earlier images)
@@ -131,10 +173,7 @@ def main():
                     right = current_index - 1
                     current_index = (left + right) // 2
                     open_image(sorted_images[current_index].path)
-                    print(f"Range: [{left}, {right}], Current: {current_index}")
-                    print(
-                        f"[{current_index + 1}/{len(sorted_images)}] {sorted_images[current_index].path}"
-                    )
+                    show_position(left, right, current_index, sorted_images)
                 else:
                     print("Cannot bisect further", file=sys.stderr)
             elif command.startswith("r"):  # redo functionality
@@ -172,18 +211,13 @@ def main():
 
                 open_image(sorted_images[current_index].path)
                 print(f"Redid {redo_count} move(s)")
-                print(f"Range: [{left}, {right}], Current: {current_index}")
-                print(
-                    f"[{current_index + 1}/{len(sorted_images)}] {sorted_images[current_index].path}"
-                )
+                show_position(left, right, current_index, sorted_images)
             else:
                 print(
                     "Unknown command. Use n=bisect right (later), p=bisect left (earlier), r [count]=redo last move(s), q=quit",
                     file=sys.stderr,
                 )
 
-        except EOFError:
-            break
         except KeyboardInterrupt:
             break
 
@@ -6,31 +6,47 @@ import datetime
 
 PROGRESS_FILE = "ffmpeg_progress.log"
 TOTAL_FRAMES = 1997
+TAIL_BYTES = 4096
+
+# Compiled once; bytes patterns because the log tail is read undecoded
+_FRAME_RE = re.compile(rb"frame=(\d+)")
+_FPS_RE = re.compile(rb"fps=([\d.]+)")
+_SPEED_RE = re.compile(rb"speed=([\d.]+)x")
 
 
 def parse_progress():
-    """Parse the latest progress from ffmpeg output"""
+    """Parse the latest progress from the tail of ffmpeg output"""
     try:
-        with open(PROGRESS_FILE, "r") as f:
-            content = f.read()
-
-        # Find the last frame number
-        frame_matches = re.findall(r"frame=(\d+)", content)
-        if not frame_matches:
+        with open(PROGRESS_FILE, "rb") as f:
+            # Only the newest values matter; re-reading the whole log
+            # every poll gets slower as ffmpeg appends to it
+            f.seek(0, 2)
+            size = f.tell()
+            f.seek(max(0, size - TAIL_BYTES))
+            tail = f.read()
+
+        # Keep only the last match of each pattern; finditer streams
+        # through the tail without building throwaway match lists
+        frame_match = None
+        for frame_match in _FRAME_RE.finditer(tail):
+            pass
+        if frame_match is None:
             return None
 
-        current_frame = int(frame_matches[-1])
+        current_frame = int(frame_match.group(1))
 
-        # Find the last fps value
-        fps_matches = re.findall(r"fps=([\d.]+)", content)
-        if not fps_matches:
+        fps_match = None
+        for fps_match in _FPS_RE.finditer(tail):
+            pass
+        if fps_match is None:
             return None
 
-        current_fps = float(fps_matches[-1])
+        current_fps = float(fps_match.group(1))
 
-        # Find the last speed value
-        speed_matches = re.findall(r"speed=([\d.]+)x", content)
-        speed = float(speed_matches[-1]) if speed_matches else None
+        speed_match = None
+        for speed_match in _SPEED_RE.finditer(tail):
+            pass
+        speed = float(speed_match.group(1)) if speed_match else None
 
         return {
             "frame": current_frame,
@@ -3,6 +3,11 @@ import json
 import pathlib
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def load_manifest(manifest_path: pathlib.Path) -> dict:
     """Load the sourdough starter manifest JSON file."""
@@ -10,12 +15,22 @@ def load_manifest(manifest_path: pathlib.Path) -> dict:
         print(f"Error: Manifest file {manifest_path} does not exist")
         sys.exit(1)
 
+    # orjson parses in C and is several times faster on large manifests
+    if orjson is not None:
+        return orjson.loads(manifest_path.read_bytes())
+
     with open(manifest_path, "r") as f:
         return json.load(f)
 
 
 def save_manifest(manifest_path: pathlib.Path, data: dict) -> None:
     """Save the manifest JSON file with proper formatting and sorted keys."""
+    if orjson is not None:
+        manifest_path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        )
+        return
+
     with open(manifest_path, "w") as f:
         json.dump(data, f, indent=2, sort_keys=True)
 
@@ -38,19 +53,23 @@ def add_missing_timestamps(video_record: dict) -> bool:
     return modified
 
 
-def report_missing_files(manifest_data: dict, existing_files: set) -> None:
-    """Report missing MP4 files."""
+def report_manifest_issues(manifest_data: dict, existing_files: set) -> None:
+    """Report missing MP4 files and incomplete records in a single pass."""
     manifest_files = set()
     missing_from_disk = []
+    incomplete_records = []
 
     for video in manifest_data.get("videos", []):
-        if "filename" in video:
-            filename = video["filename"]
+        filename = video.get("filename")
+        if filename:
             manifest_files.add(filename)
             if filename not in existing_files:
                 missing_from_disk.append(filename)
+        if video.get("incomplete_record", False):
+            sequence = video.get("sequence", "unknown")
+            incomplete_records.append((sequence, filename or "no filename"))
 
-    missing_from_manifest = existing_files - manifest_files
+    missing_from_manifest = existing_files.difference(manifest_files)
 
     if missing_from_disk:
         print("MP4 files in manifest but missing from disk:")
@@ -62,17 +81,6 @@ def report_missing_files(manifest_data: dict, existing_files: set) -> None:
         for filename in sorted(missing_from_manifest):
             print(f"  {filename}")
 
-
-def report_incomplete_records(manifest_data: dict) -> None:
-    """Report records marked as incomplete."""
-    incomplete_records = []
-
-    for video in manifest_data.get("videos", []):
-        if video.get("incomplete_record", False):
-            sequence = video.get("sequence", "unknown")
-            filename = video.get("filename", "no filename")
-            incomplete_records.append((sequence, filename))
-
     if incomplete_records:
         print("Incomplete records:")
         for sequence, filename in sorted(incomplete_records):
@@ -117,11 +125,8 @@ def main():
     if modified:
         print("Updated manifest with missing timestamp keys")
 
-    # Report missing files
-    report_missing_files(manifest_data, existing_files)
-
-    # Report incomplete records
-    report_incomplete_records(manifest_data)
+    # Report missing files and incomplete records
+    report_manifest_issues(manifest_data, existing_files)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 import argparse
+import os.path
 import sys
 import re
 import pathlib
+import functools
 import contextlib
 import select
 import typing
@@ -16,69 +18,65 @@ EXIT_SUCCESS = 0
 EXIT_NO_FILES = 1
 EXIT_INTERRUPTED = 2
 
-# Type aliases
-ParsedFile = typing.Dict[str, typing.Union[str, int, typing.Tuple[str, str, str]]]
-MediaFile = typing.Tuple[typing.Union[int, typing.Tuple[str, str, str]], str, str, str]
-ParserFunction = typing.Callable[[str], typing.Optional[ParsedFile]]
+# Combined filename pattern, compiled once at import; one match attempt
+# covers both IMG_YYYYMMDD_HHMMSS_AATPNNNN.jpg and IMG_YYYYMMDD_HHMMSS.jpg,
+# with the optional seq group discriminating between them
+_COMBINED_RE = re.compile(
+    r"IMG_(?P<date>\d{8})_(?P<time>\d{6})(?:_AATP(?P<seq>\d+))?\.jpg$"
+)
 
+# Shell characters that force quoting; a set-membership scan beats running
+# the regex engine for a plain character-class test
+_SPECIAL_CHARS = frozenset(" \t\n\r\f\v$`\"'\\;|&<>(){}*?[]~#!")
 
-def parse_filename_aatp(filepath: str) -> typing.Optional[ParsedFile]:
-    """
-    Parse filename like IMG_20250728_115906_AATP1401.jpg
-    Returns dict with date, time, and sequence number (AATP prefix removed)
-    """
-    filename = pathlib.Path(filepath).name
-    # Match pattern: IMG_YYYYMMDD_HHMMSS_AATPNNNN.jpg and extract just the number part
-    match = re.match(r"IMG_(\d{8})_(\d{6})_AATP(\d+)\.jpg$", filename)
-    if match:
-        date_str, time_str, sequence_str = match.groups()
-        return {
-            "date": date_str,
-            "time": time_str,
-            "sequence": int(sequence_str),
-            "timestamp": (date_str, time_str, sequence_str),
-            "filepath": filepath,
-            "parser_type": "aatp",
-        }
-    return None
-
-
-def parse_filename_simple(filepath: str) -> typing.Optional[ParsedFile]:
+# Type aliases
+# Parsed file tuple: (sequence, timestamp, filepath, filename, parser_type, dirname);
+# timestamp is None when the caller does not need it
+ParsedFile = typing.Tuple[
+    int, typing.Optional[typing.Tuple[str, str, str]], str, str, str, str
+]
+# Media file tuple: (sort_key, filepath, filename, parser_type, manifest_line)
+MediaFile = typing.Tuple[
+    typing.Union[int, typing.Tuple[str, str, str]], str, str, str, str
+]
+
+
+def parse_filename(
+    filepath: str, need_timestamp: bool = True
+) -> typing.Optional[ParsedFile]:
     """
-    Parse filename like IMG_20250908_150139.jpg
-    Returns dict with date, time, and synthetic sequence number based on time
+    Parse filename like IMG_20250728_115906_AATP1401.jpg (parser type
+    'aatp', sequence from the AATP number) or IMG_20250908_150139.jpg
+    (parser type 'simple', synthetic sequence from the time).
+    Returns a flat tuple carrying both possible sort keys; a dict here
+    would cost six slot writes per parsed file for nothing. Pass
+    need_timestamp=False to skip the timestamp tuple when sorting by
+    sequence.
     """
-    filename = pathlib.Path(filepath).name
-    # Match pattern: IMG_YYYYMMDD_HHMMSS.jpg
-    match = re.match(r"IMG_(\d{8})_(\d{6})\.jpg$", filename)
-    if match:
-        date_str, time_str = match.groups()
+    filename = os.path.basename(filepath)
+    match = _COMBINED_RE.match(filename)
+    if not match:
+        return None
+
+    date_str, time_str, sequence_str = match.group("date", "time", "seq")
+    if sequence_str is not None:
+        parser_type = "aatp"
+        sequence = int(sequence_str)
+        timestamp = (date_str, time_str, sequence_str) if need_timestamp else None
+    else:
+        parser_type = "simple"
         # Create synthetic sequence from time for sorting
         sequence = int(time_str)
-        return {
-            "date": date_str,
-            "time": time_str,
-            "sequence": sequence,
-            "timestamp": (date_str, time_str, "000"),
-            "filepath": filepath,
-            "parser_type": "simple",
-        }
-    return None
-
-
-def get_parser_functions(
-    pattern_types: typing.Optional[typing.List[str]] = None,
-) -> typing.List[ParserFunction]:
-    """Return list of parser functions based on pattern types"""
-    all_parsers = {
-        "aatp": parse_filename_aatp,
-        "simple": parse_filename_simple,
-    }
-
-    if pattern_types is None:
-        return list(all_parsers.values())
-
-    return [all_parsers[ptype] for ptype in pattern_types if ptype in all_parsers]
+        timestamp = (date_str, time_str, "000") if need_timestamp else None
+
+    return (
+        sequence,
+        timestamp,
+        filepath,
+        filename,
+        parser_type,
+        os.path.dirname(filepath) or ".",
+    )
 
 
 def needs_quotes(path: str) -> bool:
@@ -86,29 +84,19 @@ def needs_quotes(path: str) -> bool:
     # Don't quote command substitutions
     if path.startswith("$(") and path.endswith(")"):
         return False
-    # Check for spaces, special shell characters, etc.
-    special_chars = r'[ \t\n\r\f\v$`"\'\\;|&<>(){}*?[\]~#!]'
-    return bool(re.search(special_chars, path))
+    # Check for spaces, special shell characters, etc. isdisjoint walks
+    # the string in C and exits on the first special character
+    return not _SPECIAL_CHARS.isdisjoint(path)
 
 
-def format_path(path: typing.Union[str, pathlib.Path]) -> str:
+@functools.lru_cache(maxsize=4096)
+def format_path(path: str) -> str:
     """Format path with quotes only if needed"""
-    if needs_quotes(str(path)):
+    # str-only argument keeps the cache keyed consistently; a Path and
+    # its string form would otherwise occupy separate entries
+    if needs_quotes(path):
         return f"'{path}'"
-    return str(path)
-
-
-def get_sort_key(
-    parsed: ParsedFile, sort_by: str
-) -> typing.Union[int, typing.Tuple[str, str, str]]:
-    """Get the appropriate sort key based on sort method"""
-    if sort_by == "sequence":
-        sequence = parsed["sequence"]
-        assert isinstance(sequence, int)
-        return sequence
-    timestamp = parsed["timestamp"]
-    assert isinstance(timestamp, tuple)
-    return timestamp
+    return path
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -149,17 +137,6 @@ def parse_arguments() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def try_parse_with_functions(
-    filepath: str, parser_functions: typing.List[ParserFunction]
-) -> typing.Optional[ParsedFile]:
-    """Try parsing filepath with multiple parser functions, return first successful match"""
-    for parser_func in parser_functions:
-        result = parser_func(filepath)
-        if result:
-            return result
-    return None
-
-
 def check_stdin_available() -> bool:
     """Check if stdin has data available without blocking"""
     if sys.stdin.isatty():
@@ -177,34 +154,66 @@ def check_stdin_available() -> bool:
 def read_and_parse_files(
     input_source: typing.TextIO,
     sort_by: str,
-    parser_functions: typing.List[ParserFunction],
+    allowed_patterns: typing.Optional[typing.Set[str]] = None,
     is_stdin: bool = False,
     quiet: bool = False,
-) -> typing.Tuple[typing.List[MediaFile], typing.Set[str]]:
-    """Read files from input source and parse them into sorted list using provided parser functions"""
+) -> typing.Tuple[typing.List[MediaFile], typing.Set[str], typing.Set[str]]:
+    """Read files from input source and parse them into a sorted list"""
     media_files: typing.List[MediaFile] = []
     mount_paths: typing.Set[str] = set()
+    used_patterns: typing.Set[str] = set()
+    last_parent = None
+    # Tuple index of the chosen sort key, resolved once outside the
+    # loop; sequence sorts skip building the timestamp tuple entirely
+    need_timestamp = sort_by != "sequence"
+    key_index = 1 if need_timestamp else 0
 
     # Show helpful message if waiting for stdin
     if is_stdin and not check_stdin_available() and not quiet:
         print("Waiting for input on stdin (Ctrl+C to cancel)...", file=sys.stderr)
 
     try:
-        for line in input_source:
+        # One bulk read beats per-line iteration; piped input with
+        # thousands of paths otherwise pays Python-level dispatch per
+        # line. For stdin, read raw bytes and decode once rather than
+        # going through the text wrapper's incremental decoder.
+        if is_stdin:
+            data = sys.stdin.buffer.read().decode("utf-8", "surrogateescape")
+        else:
+            data = input_source.read()
+        for line in data.splitlines():
             filepath = line.strip()
             if not filepath:
                 continue
 
-            parsed = try_parse_with_functions(filepath, parser_functions)
+            parsed = parse_filename(filepath, need_timestamp)
             if parsed:
-                sort_key = get_sort_key(parsed, sort_by)
-                path = pathlib.Path(str(parsed["filepath"]))
-                parser_type = parsed["parser_type"]
-                assert isinstance(parser_type, str)
+                parser_type = parsed[4]
+                if allowed_patterns is not None and parser_type not in allowed_patterns:
+                    continue
+                # Tracked inline so the summary needs no extra pass later
+                used_patterns.add(parser_type)
+                # The parser already split the path; reuse its pieces
+                # instead of allocating a Path per file, and format the
+                # manifest line now so script generation is a plain join.
+                # The strict filename regex guarantees the basename holds
+                # no shell specials, so no format_path quoting check here.
+                filename = parsed[3]
                 media_files.append(
-                    (sort_key, str(parsed["filepath"]), path.name, parser_type)
+                    (
+                        parsed[key_index],
+                        filepath,
+                        filename,
+                        parser_type,
+                        f"file /config/{filename}\n",
+                    )
                 )
-                mount_paths.add(str(path.parent))
+                # Camera dumps usually share one directory; skip the
+                # set insert when the parent repeats
+                parent = parsed[5]
+                if parent != last_parent:
+                    mount_paths.add(parent)
+                    last_parent = parent
     except KeyboardInterrupt:
         if not quiet:
             if is_stdin:
@@ -213,32 +222,20 @@ def read_and_parse_files(
                 print("\nOperation interrupted", file=sys.stderr)
         raise
 
-    media_files.sort(key=lambda x: x[0])
-    return media_files, mount_paths
-
+    # The sort key is the first tuple element, so a bare sort compares
+    # natively in C with no per-element key callback
+    media_files.sort()
+    return media_files, mount_paths, used_patterns
 
-def create_manifest_content(media_files: typing.List[MediaFile]) -> typing.List[str]:
-    """Create the manifest file content"""
-    manifest_content: typing.List[str] = []
-    for sort_key, full_path, filename, parser_type in media_files:
-        docker_path = f"/config/{filename}"
-        manifest_content.append(f"file {format_path(docker_path)}\n")
-    return manifest_content
 
+def build_manifest_section(media_files: typing.List[MediaFile]) -> str:
+    """Build the manifest file creation section"""
+    body = "".join(item[-1] for item in media_files)
+    return f"# Create manifest file\ncat > ffmpeg_list.txt << 'EOF'\n{body}EOF\n\n"
 
-def write_manifest_section(
-    f: typing.TextIO, manifest_content: typing.List[str]
-) -> None:
-    """Write the manifest file creation section"""
-    f.write("# Create manifest file\n")
-    f.write("cat > ffmpeg_list.txt << 'EOF'\n")
-    for line in manifest_content:
-        f.write(line)
-    f.write("EOF\n\n")
 
-
-def write_docker_command(f: typing.TextIO, mount_paths: typing.Set[str]) -> None:
-    """Write the docker command section"""
+def build_docker_command(mount_paths: typing.Set[str]) -> str:
+    """Build the docker command section"""
     # Build mount volume arguments
     mount_args = []
     for mount_path in sorted(mount_paths):
@@ -264,7 +261,7 @@ lscr.io/linuxserver/ffmpeg:latest \\
 /workspace/timelapse.mp4
 """
 
-    f.write(docker_command)
+    return docker_command
 
 
 def get_output_context(output_file: str) -> typing.ContextManager[typing.TextIO]:
@@ -278,14 +275,16 @@ def generate_script(
     output_file: str, media_files: typing.List[MediaFile], mount_paths: typing.Set[str]
 ) -> None:
     """Generate the complete bash script"""
-    manifest_content = create_manifest_content(media_files)
+    # Assemble the whole script first so it hits the output as a single
+    # buffered write
+    script = (
+        "#!/bin/bash\n# Generated ffmpeg script\n\n"
+        + build_manifest_section(media_files)
+        + build_docker_command(mount_paths)
+    )
 
     with get_output_context(output_file) as f:
-        f.write("#!/bin/bash\n")
-        f.write("# Generated ffmpeg script\n\n")
-
-        write_manifest_section(f, manifest_content)
-        write_docker_command(f, mount_paths)
+        f.write(script)
 
     # Make the script executable only if it's a file (not stdout)
     if output_file != "-":
@@ -296,7 +295,7 @@ def print_summary(
     output_file: str,
     media_files: typing.List[MediaFile],
     sort_by: str,
-    used_patterns: typing.List[str],
+    used_patterns: typing.Set[str],
 ) -> None:
     """Print summary information to stderr"""
     sort_method = "sequence number" if sort_by == "sequence" else "timestamp"
@@ -315,11 +314,6 @@ def print_summary(
         )
 
 
-def get_used_patterns(media_files: typing.List[MediaFile]) -> typing.List[str]:
-    """Extract unique parser types used from media files"""
-    return list(set(item[3] for item in media_files))
-
-
 def get_input_source(
     input_file: typing.Optional[str],
 ) -> typing.ContextManager[typing.TextIO]:
@@ -331,14 +325,14 @@ def get_input_source(
 
 def load_media_files(
     args: argparse.Namespace,
-) -> typing.Tuple[typing.List[MediaFile], typing.Set[str]]:
+) -> typing.Tuple[typing.List[MediaFile], typing.Set[str], typing.Set[str]]:
     """Load and parse media files from input source"""
-    parser_functions = get_parser_functions(args.patterns)
+    allowed_patterns = set(args.patterns) if args.patterns is not None else None
 
     with get_input_source(args.input_file) as input_source:
         is_stdin = args.input_file is None
         return read_and_parse_files(
-            input_source, args.sort_by, parser_functions, is_stdin, args.quiet
+            input_source, args.sort_by, allowed_patterns, is_stdin, args.quiet
         )
 
 
@@ -359,7 +353,7 @@ def handle_error(
 def process_files(args: argparse.Namespace) -> int:
     """Process files and generate script, handling all errors"""
     try:
-        media_files, mount_paths = load_media_files(args)
+        media_files, mount_paths, used_patterns = load_media_files(args)
     except (KeyboardInterrupt, IOError) as e:
         return handle_error(e, args)
 
@@ -372,7 +366,6 @@ def process_files(args: argparse.Namespace) -> int:
         generate_script(args.script_output, media_files, mount_paths)
 
         if not args.quiet:
-            used_patterns = get_used_patterns(media_files)
             print_summary(args.script_output, media_files, args.sort_by, used_patterns)
 
     except KeyboardInterrupt:
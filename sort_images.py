@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 
 import argparse
+import operator
 import os
 import re
 
+# Pattern: IMG_YYYYMMDD_HHMMSS_AATPNNNN.jpg, compiled once at import so
+# the per-file parse skips the re-cache lookup
+_AATP_RE = re.compile(r"IMG_(\d{8})_(\d{6})_AATP(\d+)\.jpg$")
+
 
 def parse_filename(filename):
     """
@@ -11,7 +16,7 @@ def parse_filename(filename):
     Returns dict with date, time, and sequence number (AATP prefix removed)
     """
     # Match pattern: IMG_YYYYMMDD_HHMMSS_AATPNNNN.jpg and extract just the number part
-    match = re.match(r"IMG_(\d{8})_(\d{6})_AATP(\d+)\.jpg$", filename)
+    match = _AATP_RE.match(filename)
     if match:
         date_str, time_str, sequence_str = match.groups()
         return {
@@ -69,8 +74,8 @@ def main():
         print(f"No matching image files found in '{args.directory}'")
         return 1
 
-    # Sort by the chosen method
-    jpg_files.sort(key=lambda x: x[0])
+    # Sort by the chosen method; itemgetter extracts the key in C
+    jpg_files.sort(key=operator.itemgetter(0))
 
     # Write output file
     with open(args.output, "w") as f:
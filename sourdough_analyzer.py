@@ -4,10 +4,21 @@ import argparse
 import json
 import yaml
 from typing import Dict, List, Any
-from collections import defaultdict
 from rich.console import Console
 from rich.table import Table
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The libyaml C loader is an order of magnitude faster than the pure
+# Python SafeLoader that yaml.safe_load picks
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 def parse_duration_seconds(seconds: int) -> str:
     """Convert seconds to human-friendly duration format"""
@@ -27,36 +38,55 @@ def parse_duration_seconds(seconds: int) -> str:
         return f"{remaining_seconds}s"
 
 
+def ratio_sort_key(item) -> str:
+    """Sort key for (ratio, data) pairs that sends 'unknown' to the end"""
+    ratio = item[0]
+    return ratio if ratio != "unknown" else "zzz"
+
+
 def load_data(file_path: str) -> Dict[str, Any]:
     """Load data from JSON or YAML file"""
+    # orjson parses in C when available; orjson.JSONDecodeError subclasses
+    # json.JSONDecodeError so the fallback handling below still applies
+    loads = orjson.loads if orjson is not None else json.loads
+
     with open(file_path, "r") as f:
         if file_path.lower().endswith(".json"):
-            return json.load(f)
+            return loads(f.read())
         elif file_path.lower().endswith((".yml", ".yaml")):
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=YamlLoader)
         else:
-            # Try to detect format by content
+            # Detect format by content: a leading { or [ means JSON, so
+            # the worst case is one parse instead of a failed JSON parse
+            # followed by a full YAML parse
             content = f.read()
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError:
+            if content.lstrip()[:1] in ("{", "["):
                 try:
-                    return yaml.safe_load(content)
-                except yaml.YAMLError:
-                    raise ValueError(
-                        "File format not recognized. Please use .json or .yaml/.yml extension"
-                    )
+                    return loads(content)
+                except json.JSONDecodeError:
+                    pass
+            try:
+                return yaml.load(content, Loader=YamlLoader)
+            except yaml.YAMLError:
+                raise ValueError(
+                    "File format not recognized. Please use .json or .yaml/.yml extension"
+                )
 
 
 def group_by_ratio(videos: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
-    """Group videos by ratio"""
-    grouped = defaultdict(list)
+    """Group videos by ratio, ordered by ratio with 'unknown' last"""
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
 
     for video in videos:
         ratio = video.get("ratio", "unknown")
-        grouped[ratio].append(video)
+        bucket = grouped.get(ratio)
+        if bucket is None:
+            grouped[ratio] = bucket = []
+        bucket.append(video)
 
-    return dict(grouped)
+    # Sort the few groups once here; downstream display relies on dict
+    # insertion order instead of re-sorting per view
+    return dict(sorted(grouped.items(), key=ratio_sort_key))
 
 
 def calculate_duration_differences(
@@ -69,13 +99,27 @@ def calculate_duration_differences(
         if not videos:
             continue
 
-        durations = [v["duration_seconds"] for v in videos if "duration_seconds" in v]
-        if not durations:
+        # One pass collects count, sum, min, and max instead of building
+        # a throwaway list and walking it three times
+        total = 0
+        count = 0
+        min_duration = None
+        max_duration = None
+        for video in videos:
+            duration = video.get("duration_seconds")
+            if duration is None:
+                continue
+            total += duration
+            count += 1
+            if min_duration is None or duration < min_duration:
+                min_duration = duration
+            if max_duration is None or duration > max_duration:
+                max_duration = duration
+
+        if count == 0:
             continue
 
-        avg_duration = sum(durations) / len(durations)
-        min_duration = min(durations)
-        max_duration = max(durations)
+        avg_duration = total / count
 
         results[ratio] = {
             "count": len(videos),
@@ -102,12 +146,8 @@ def display_results(results: Dict[str, Dict[str, Any]], console: Console):
     table.add_column("Max Peak Time", justify="center", style="red")
     table.add_column("Range", justify="center", style="yellow")
 
-    # Sort by ratio for consistent display
-    sorted_results = sorted(
-        results.items(), key=lambda x: x[0] if x[0] != "unknown" else "zzz"
-    )
-
-    for ratio, data in sorted_results:
+    # Results are already ordered by ratio ('unknown' last) from grouping
+    for ratio, data in results.items():
         range_diff = data["max_duration_seconds"] - data["min_duration_seconds"]
         range_human = (
             parse_duration_seconds(int(range_diff)) if range_diff > 0 else "0m"
@@ -127,7 +167,7 @@ def display_results(results: Dict[str, Dict[str, Any]], console: Console):
 
 def display_detailed_results(results: Dict[str, Dict[str, Any]], console: Console):
     """Display detailed results for each ratio"""
-    for ratio, data in sorted(results.items()):
+    for ratio, data in results.items():
         console.print(f"\n[bold cyan]Ratio {ratio}:[/bold cyan]")
 
         detail_table = Table(show_header=True, header_style="bold magenta")
@@ -1,20 +1,13 @@
 import argparse
 import json
 import pathlib
+import sys
 import datetime
 
-
-def parse_iso_datetime(datetime_str):
-    """Parse ISO format datetime string to datetime object."""
-    return datetime.datetime.fromisoformat(datetime_str)
-
-
-def calculate_duration_seconds(start_time, end_time):
-    """Calculate duration in seconds between two datetime strings."""
-    start_dt = parse_iso_datetime(start_time)
-    end_dt = parse_iso_datetime(end_time)
-    duration = end_dt - start_dt
-    return int(duration.total_seconds())
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def format_duration(duration_seconds):
@@ -33,24 +26,33 @@ def format_duration(duration_seconds):
         return f"{seconds}s"
 
 
-def update_manifest_durations(manifest_path):
+def update_manifest_durations(manifest_path, quiet=False):
     """Update duration fields in manifest JSON file."""
     manifest_file = pathlib.Path(manifest_path)
 
     if not manifest_file.exists():
         raise FileNotFoundError(f"Manifest file not found: {manifest_path}")
 
-    # Read the manifest
-    with open(manifest_file, "r", encoding="utf-8") as f:
-        manifest = json.load(f)
+    # Read the manifest; orjson parses in C when available
+    if orjson is not None:
+        manifest = orjson.loads(manifest_file.read_bytes())
+    else:
+        with open(manifest_file, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
 
-    # Update each video entry
+    # Update each video entry; bind fromisoformat once so each video
+    # pays a single C call per timestamp instead of wrapper frames
     updated_count = 0
+    log_lines = []
+    fromisoformat = datetime.datetime.fromisoformat
     for video in manifest.get("videos", []):
         if "start_time" in video and "end_time" in video:
             # Calculate duration in seconds
-            duration_seconds = calculate_duration_seconds(
-                video["start_time"], video["end_time"]
+            duration_seconds = int(
+                (
+                    fromisoformat(video["end_time"])
+                    - fromisoformat(video["start_time"])
+                ).total_seconds()
             )
 
             # Format human-readable duration
@@ -61,16 +63,27 @@ def update_manifest_durations(manifest_path):
             video["duration"] = duration_formatted
             updated_count += 1
 
-            print(
-                f"Updated {video.get('filename', 'unknown')}: {duration_formatted} ({duration_seconds}s)"
-            )
+            # Buffer the log line; one writelines after the loop beats a
+            # print (and stdout flush) per video
+            if not quiet:
+                log_lines.append(
+                    f"Updated {video.get('filename', 'unknown')}: {duration_formatted} ({duration_seconds}s)\n"
+                )
 
     # Write back to file
-    with open(manifest_file, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2, ensure_ascii=False)
-        f.write("\n")
-
-    print(f"\nUpdated {updated_count} video entries in {manifest_path}")
+    if orjson is not None:
+        manifest_file.write_bytes(
+            orjson.dumps(manifest, option=orjson.OPT_INDENT_2) + b"\n"
+        )
+    else:
+        with open(manifest_file, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+
+    if log_lines:
+        sys.stdout.writelines(log_lines)
+    if not quiet:
+        print(f"\nUpdated {updated_count} video entries in {manifest_path}")
     return updated_count
 
 
@@ -84,11 +97,17 @@ def main():
         default="sourdough-starter-manifest.json",
         help="Path to the manifest JSON file (default: sourdough-starter-manifest.json)",
     )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="Don't print per-video updates or the summary",
+    )
 
     args = parser.parse_args()
 
     try:
-        update_manifest_durations(args.manifest_path)
+        update_manifest_durations(args.manifest_path, args.quiet)
     except FileNotFoundError as e:
         print(f"Error: {e}")
         return 1